@@ -4,9 +4,11 @@ API for TextGrid intervals. Mainly useful for tokenizing the interval text.
 """
 
 from collections import namedtuple
+from dataclasses import dataclass
 from enum import Enum
 import re
-from typing import List, Optional, Pattern, Tuple
+import sys
+from typing import Iterator, List, Optional, Pattern, Tuple
 
 
 IntervalTuple = namedtuple('Interval', 'xmin, xmax, text, index, textgrid, raw')
@@ -105,8 +107,17 @@ TAGS_BALANCED = [
     ,Tag.II
 ]
 
+# Lowercased non-content tag values, interned so the membership checks in
+# the tokenizers hit the str hash/equality fast paths
+_TAGS_NONCONTENT_LOWER = frozenset(sys.intern(t.value.lower())
+                                   for t in TAGS_NONCONTENT)
 
-def truncated(s, maxlen=30):
+
+# Distinguishes "no tag passed" from an explicit tag=None in Token
+_UNSET = object()
+
+
+def truncated(s: str, maxlen: int = 30) -> str:
     if len(s) > maxlen:
         s = s[:maxlen - 3] + '...'
     return s
@@ -118,17 +129,57 @@ def make_regex_pattern(*token_patterns) -> Pattern:
     return re.compile(s)
 
 
-class IntervalError(ValueError):
-    def __init__(self, interval, detail=''):
-        if detail:
-            detail = ' (%s)' % detail
+# Alternation components for the token patterns, assembled once at import so
+# pattern construction never re-escapes or re-lowercases tag values at
+# runtime. Order matters and is shared by both patterns below: non-content
+# tags, then words, then balanced spans.
+
+# Words & phrases: cake, p_s_l_e, p-five, incomple~
+_CLITIC_CHARS = ''.join(re.escape(t.value) for t in TAGS_CLITIC)
+_WORD_ALTERNATIVE = "[\\w%s']+" % _CLITIC_CHARS
 
-        tg = f' in {interval.textgrid}' if interval.textgrid else ''
+_BALANCED_SPLIT = tuple(tuple(t.value.lower().split()) for t in TAGS_BALANCED)
 
-        errmsg = 'Failed to process interval {}{}'.format(
-            interval.index, interval.textgrid, detail)
+_TOKEN_ALTERNATIVES = tuple(
+    [re.escape(t.value.lower()) for t in TAGS_NONCONTENT]
+    + [_WORD_ALTERNATIVE]
+    + [re.escape(left) + r"[\w\-_\s']+" + re.escape(right)
+       for left, right in _BALANCED_SPLIT]
+)
 
-        super().__init__(errmsg)
+# Same alternatives wrapped in named groups (Tag member names, or 'word'),
+# so Match.lastgroup identifies the Tag of each token during lexing
+_LEXER_ALTERNATIVES = tuple(
+    ['(?P<{}>{})'.format(t.name, re.escape(t.value.lower()))
+     for t in TAGS_NONCONTENT]
+    + ["(?P<word>%s)" % _WORD_ALTERNATIVE]
+    + ['(?P<{}>{}{}{})'.format(t.name, re.escape(left), r"[\w\-_\s']+",
+                               re.escape(right))
+       for t, (left, right) in zip(TAGS_BALANCED, _BALANCED_SPLIT)]
+)
+
+_TOKENS_PATTERN = make_regex_pattern(*_TOKEN_ALTERNATIVES)
+_LEXER_PATTERN = re.compile('|'.join(_LEXER_ALTERNATIVES))
+
+
+class IntervalError(ValueError):
+    """Raised when an interval can't be processed.
+
+    The message is only formatted in __str__, so errors that get caught
+    and discarded (e.g. during bulk validation) cost no string work.
+    The old eager formatting also passed detail as a surplus argument to
+    str.format, silently dropping it from the message.
+    """
+    def __init__(self, interval, detail=''):
+        super().__init__()
+        self.interval = interval
+        self.detail = detail
+
+    def __str__(self):
+        detail = f' ({self.detail})' if self.detail else ''
+        tg = (f' in {self.interval.textgrid}'
+              if self.interval.textgrid else '')
+        return f'Failed to process interval {self.interval.index}{tg}{detail}'
 
 
 class TranscriptionError(IntervalError):
@@ -137,46 +188,68 @@ class TranscriptionError(IntervalError):
         super().__init__(interval, detail)
 
 
-class Interval(object):
+# eq=False keeps the identity equality and hashability the pre-dataclass
+# class had; generated value equality would set __hash__ = None
+@dataclass(slots=True, eq=False)
+class Interval:
     """API for TextGrid intervals. Main application is the tokenize() method."""
-    __slots__ = ['xmin', 'xmax', 'text', 'index', 'textgrid', 'raw', '_args']
-
-    interval_fields = r"""intervals \[(?P<index>\d+)\]\:\s+xmin\s+=\s+(?P<xmin>(\d+\.)?\d+)\s+xmax\s+=\s+(?P<xmax>(\d+\.)?\d+)\s+text\s+=\s+\"(?P<text>.*)\""""
+    index: int
+    xmin: float
+    xmax: float
+    text: str
+    raw: str
+    textgrid: Optional[str] = None
+
+    # The text group matches ooTextFile escaping, where an embedded quote
+    # is doubled (""), without the backtracking a bare .* would allow
+    interval_fields = r"""intervals \[(?P<index>\d+)\]\:\s+xmin\s+=\s+(?P<xmin>(\d+\.)?\d+)\s+xmax\s+=\s+(?P<xmax>(\d+\.)?\d+)\s+text\s+=\s+\"(?P<text>(?:[^"]|"")*)\""""
     interval_pattern = re.compile(interval_fields)
 
-    interval_grouped = r"""(intervals \[\d+\]\:\s+xmin\s+=\s+(\d+\.)?\d+\s+xmax\s+=\s+(\d+\.)?\d+\s+text\s+=\s+\".*\")+"""
+    # Kept for backwards compatibility; matches a single interval block.
+    # The old pattern wrapped interval_fields in a capturing (...)+ group,
+    # which findall() callers had to unpack and which could backtrack badly.
+    interval_grouped = interval_fields
     interval_grouped_pattern = re.compile(interval_grouped)
 
-
-    def __init__(self, xmin, xmax, text, index, raw, textgrid=None):
-        self.index = int(index)
-        self.xmin = float(xmin)
-        self.xmax = float(xmax)
-        self.text = text
-        self.textgrid = textgrid
-        self.raw = raw
-        self._args = (xmin, xmax, text, index, textgrid, raw)
+    # Compiled once at module import; make_tokens_pattern() and
+    # make_lexer_pattern() just return these
+    _tokens_pattern = _TOKENS_PATTERN
+    _lexer_pattern = _LEXER_PATTERN
 
 
     @classmethod
-    def from_text(cls, raw, textgrid=None):
+    def from_text(cls, raw: str, textgrid: Optional[str] = None) -> 'Interval':
         match = cls.interval_pattern.match(raw.strip())
 
         if not match:
             raise ValueError('bad interval format')
 
-        kwargs = match.groupdict()
-        kwargs.update({'raw': raw, 'textgrid': textgrid})
-
-        obj = cls.__new__(cls)
-        obj.__init__(**kwargs)
+        obj = cls._from_match(match, textgrid=textgrid)
+        obj.raw = raw
         return obj
 
 
+    @classmethod
+    def _from_match(cls, match: re.Match,
+                    textgrid: Optional[str] = None) -> 'Interval':
+        """Builds an Interval from a match of interval_pattern.
+
+        Takes the fields straight from the match groups, skipping the
+        groupdict() allocation and the redundant re-match that from_text()
+        would perform on already-matched text.
+        """
+        return cls(index=int(match.group('index')),
+                   xmin=float(match.group('xmin')),
+                   xmax=float(match.group('xmax')),
+                   text=match.group('text'),
+                   raw=match.group(0),
+                   textgrid=textgrid)
+
 
     @property
     def tuple(self):
-        return IntervalTuple(*self._args)
+        return IntervalTuple(self.xmin, self.xmax, self.text,
+                             self.index, self.textgrid, self.raw)
 
 
     @property
@@ -184,61 +257,83 @@ class Interval(object):
         return self.tokenize(self.text)
 
 
-    @classmethod
-    def make_tokens_pattern(cls) -> Pattern:
-        """Make pattern to use in re.findall().
+    @property
+    def itokens(self):
+        """Generator over this interval's Tokens; see itokenize()"""
+        return self.itokenize(self.text)
 
-        By default, creates a lowercased pattern out of the tags defined in this
-        module. To customize the tokenizer pattern, override this method. The
-        returned pattern will be directly passed to re.findall().
 
-        The default pattern will treat segments enclosed within TAGS_BALANCED
-        and TAGS_CENSORED as single tokens. No further tokenizing will be
-        performed for text segments within these tags.
+    @classmethod
+    def make_tokens_pattern(cls) -> Pattern:
+        """Returns the anonymous token pattern, suitable for re.findall().
 
-        The default pattern assumes that the text to be searched is all in
+        A lowercased pattern out of the tags defined in this module, with
+        each match being one whole token. The pattern treats segments
+        enclosed within TAGS_BALANCED and TAGS_CENSORED as single tokens;
+        no further tokenizing will be performed for text segments within
+        these tags. It assumes that the text to be searched is all in
         lowercase.
-        """
-        re_escape = re.escape
-        tags = [re_escape(t.value.lower())
-                for t in TAGS_NONCONTENT]
 
-        # Words & phrases: cake, p_s_l_e, p-five, incomple~
-        clitics = (re_escape(t.value) for t in TAGS_CLITIC)
-        tags.append("[\\w%s']+" % ''.join(clitics))
+        Note that tokenize() and itokenize() do NOT use this pattern; they
+        are driven solely by make_lexer_pattern() and _lexer_pattern, which
+        match the same token boundaries but also identify each token's Tag.
+        Overriding this method does not affect tokenization — subclasses
+        that want a custom tokenizer must override make_lexer_pattern()
+        (or assign to their own _lexer_pattern) instead.
+        """
+        return cls._tokens_pattern
 
-        balanced_tags = [tuple(t.value.lower().split())
-                         for t in TAGS_BALANCED]
-        for (left, right) in balanced_tags:
-            tags.append(re_escape(left) + r"[\w\-_\s']+" + re_escape(right))
 
-        return make_regex_pattern(*tags)
+    @classmethod
+    def make_lexer_pattern(cls) -> Pattern:
+        """Like make_tokens_pattern(), but each tag gets its own named group.
+
+        Matching with this pattern identifies the Tag of each token directly
+        through Match.lastgroup (the group names are Tag member names, or
+        'word' for plain words), so the tokenizer can hand Token a
+        pre-identified tag instead of having Token re-scan the string.
+
+        This is the pattern tokenize() and itokenize() actually scan with;
+        it is the extension point for customizing tokenization. The
+        alternatives are laid out in the same order as in
+        make_tokens_pattern(), so both patterns match identical token
+        boundaries. The pattern is compiled once at module import; to
+        customize it, override this method or assign a compiled pattern to
+        the subclass's _lexer_pattern (keeping the named-group convention
+        that itokenize() relies on).
+        """
+        return cls._lexer_pattern
 
 
     @classmethod
-    def tokenize(cls,
-                 text,
-                 force_lowercase=True,
-                 discard_fillers=True,
-                 discard_noncontent=True,
-                 discard_incomplete=True,
-                 cleanup_token=True) -> List[str]:
-        """Tokenizes interval text using Pattern from make_tokens_pattern()
-
-        By default, the interval text is set to lowercase before it is passed to
-        re.findall().
+    def itokenize(cls,
+                  text: str,
+                  force_lowercase: bool = True,
+                  discard_fillers: bool = True,
+                  discard_noncontent: bool = True,
+                  discard_incomplete: bool = True,
+                  cleanup_token: bool = True) -> Iterator['Token']:
+        """Lazily yields Tokens from interval text; see tokenize()
+
+        Generator form of tokenize(): the text is scanned with a single
+        finditer and Tokens are produced one at a time, so no intermediate
+        match list or token list is materialized. Callers that only iterate
+        should prefer this over tokenize() on long intervals.
         """
         text = text.lower() if force_lowercase else text
-        patt = cls.make_tokens_pattern()
+        patt = cls.make_lexer_pattern()
 
         # Bind stuff to local scope
         _token = Token
-        noncontent = [x.value for x in TAGS_NONCONTENT]
+        _sentinels = Token._tag_sentinels
         if force_lowercase:
-            noncontent = [x.lower() for x in noncontent]
+            noncontent = _TAGS_NONCONTENT_LOWER
+        else:
+            noncontent = frozenset(x.value for x in TAGS_NONCONTENT)
 
         # The function to map
-        def maketoken(word):
+        def maketoken(match):
+            word = match.group()
             _startswith = word.startswith
             _endswith = word.endswith
 
@@ -249,10 +344,49 @@ class Interval(object):
                     and not _startswith('(pp'))
             ):
                 return None
-            return _token(word, cleanup=cleanup_token)
 
-        # Execute the map over tokens from re.findall() and return as list
-        return [x for x in map(maketoken, patt.findall(text)) if x]
+            kind = match.lastgroup
+            if kind != 'word':
+                # Tag already identified by the lexer group
+                return _token(word, cleanup=cleanup_token,
+                              already_lower=force_lowercase, tag=Tag[kind])
+            if _sentinels.isdisjoint(word):
+                # Plain word; no clitic characters, so no tag possible
+                return _token(word, cleanup=cleanup_token,
+                              already_lower=force_lowercase, tag=None)
+            # Word with clitics (p-five, a_b, foo~); let Token find the tag
+            return _token(word, cleanup=cleanup_token,
+                          already_lower=force_lowercase)
+
+        # Stream tokens from finditer(), dropping the discarded ones
+        for match in patt.finditer(text):
+            token = maketoken(match)
+            if token:
+                yield token
+
+
+    @classmethod
+    def tokenize(cls,
+                 text: str,
+                 force_lowercase: bool = True,
+                 discard_fillers: bool = True,
+                 discard_noncontent: bool = True,
+                 discard_incomplete: bool = True,
+                 cleanup_token: bool = True) -> List['Token']:
+        """Tokenizes interval text using Pattern from make_lexer_pattern()
+
+        By default, the interval text is set to lowercase before it is
+        scanned. Each match carries its Tag through the lexer's named
+        groups, so Token construction skips its own tag detection.
+
+        Returns a list; use itokenize() to consume tokens lazily.
+        """
+        return list(cls.itokenize(text,
+                                  force_lowercase=force_lowercase,
+                                  discard_fillers=discard_fillers,
+                                  discard_noncontent=discard_noncontent,
+                                  discard_incomplete=discard_incomplete,
+                                  cleanup_token=cleanup_token))
 
 
     def validate(self, strict=True) -> bool:
@@ -283,31 +417,79 @@ class Token(object):
     balanced_pairs = [(left.lower(), right.lower())
                       for (left, right) in Tag.balancedpairs()]
 
-    def __init__(self, string, cleanup=True):
-        s = string.lower()
+    # Lowercased, interned anchor (opening part of the tag value) per Tag,
+    # precomputed once at import so __init__ doesn't redo the lower/split
+    # per token
+    _tag_anchors = tuple((tag, sys.intern(tag.value.lower().split()[0]))
+                         for tag in Tag)
+
+    # One alternation over all anchors so tag detection is a single C-level
+    # scan rather than one substring search per Tag. Longest-first ordering
+    # makes e.g. '<spk/>' win over '<s>' at the same position.
+    _tag_scan = re.compile('|'.join(
+        re.escape(anchor)
+        for anchor in sorted((a for _, a in _tag_anchors),
+                             key=len, reverse=True)))
+    _anchor_to_tag = {anchor: tag for tag, anchor in _tag_anchors}
+
+    # Characters that appear in tag markup; a string disjoint from these
+    # cannot contain any tag, so tag detection can be skipped entirely
+    _tag_sentinels = frozenset(
+        c for tag in Tag for c in tag.value
+        if not (c.isalnum() or c.isspace())
+    )
+
+    # Characters that appear in balanced tag markup; a string disjoint from
+    # these cannot contain an unbalanced tag, so the pair check can be
+    # skipped (e.g. for noise tags like '<spk/>')
+    _balanced_sentinels = frozenset(
+        c for pair in balanced_pairs for side in pair for c in side
+    )
+
+    def __init__(self, string: str, cleanup: bool = True,
+                 already_lower: bool = False, tag=_UNSET):
+        s = string if already_lower else string.lower()
 
         self.raw = string
-        self.tag = None
         self.content = None
         self.text = None
 
-        # Parsing for self.tag
-        for tagtype, repres in Tag.__members__.items():
-            v = repres.value.lower().split()[0]
-            if v in s:
-                self.tag = Tag[tagtype]
-                break
-
-        for left, right in self.balanced_pairs:
-            if (left in s) == (right in s):
-                continue
-            raise ValueError('unbalanced tags in ' + self.raw)
+        if tag is not _UNSET:
+            # Caller already identified the tag (e.g. through the lexer in
+            # Interval.tokenize); trust it and skip detection entirely
+            self.tag = tag
+
+        # Fast path: plain words (the vast majority of tokens) contain none
+        # of the tag markup characters, so skip detection altogether
+        elif self._tag_sentinels.isdisjoint(s):
+            self.tag = None
+
+        else:
+            # Parsing for self.tag
+            self.tag = None
+            m = self._tag_scan.search(s)
+            if m:
+                self.tag = self._anchor_to_tag[m.group()]
+
+            if not self._balanced_sentinels.isdisjoint(s):
+                for left, right in self.balanced_pairs:
+                    if (left in s) == (right in s):
+                        continue
+                    raise ValueError('unbalanced tags in ' + self.raw)
 
         if not cleanup:
             self.content = s
             self.text = s
             return
-        
+
+        if self.tag is None:
+            # Nothing to strip or reapply; just extract and normalize words
+            cont = self.words_pattern.search(s)
+            content = cont.group() if cont else ''
+            self.content = ' '.join(content.split())
+            self.text = self.content
+            return
+
         # Strip tags to get self.content
         content = s
         if self.tag:
@@ -49,24 +49,41 @@ for iv in conv.linearize():
 """
 
 
-from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+import heapq
+import operator
 import os
 import re
 import warnings
 
-from .interval import Interval
+from .interval import Interval, Tag, Token, _TAGS_NONCONTENT_LOWER
 
 
 # Aliases for type annotation
 Directory = str
 
 
-def recursive_get_files(path):
-    """Yields all files in the given path, including in subdirs"""
-    _join = os.path.join
-    for dirpath, _, filenames in os.walk(path):
-        for file in filenames:
-            yield _join(dirpath, file)
+def recursive_get_files(path, extensions=None):
+    """Yields all files in the given path, including in subdirs
+
+    Walks with os.scandir rather than os.walk so directory-vs-file checks
+    reuse the dirent data already fetched, avoiding an extra stat per entry.
+
+    Arguments:
+    extensions: tuple of str - Optional lowercase suffixes (including the
+                               leading .) to filter by, e.g. ('.wav',).
+                               Files not ending in one of these are skipped
+                               without leaving the loop.
+    """
+    stack = [path]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif extensions is None or \
+                        entry.name.lower().endswith(extensions):
+                    yield entry.path
 
 
 class CorpusLoader:
@@ -94,6 +111,11 @@ class CorpusLoader:
     file_pattern_sameroom = re.compile(r'(\d{4})-[12]')
     file_pattern_seproom = re.compile(r'(conf_\d{4}_\d{4})_\d{8}')
 
+    # Both filename formats in one alternation so each file needs only a
+    # single match() call; the named group tells which format matched
+    file_pattern_combined = re.compile(
+        r'(?:(?P<same>\d{4})-[12]|(?P<sep>conf_\d{4}_\d{4})_\d{8})')
+
     def __init__(self, rootdir: Directory):
         self.CORPUS_DIRECTORY = None
         self.file_cache = {}
@@ -205,17 +227,14 @@ class CorpusLoader:
         self._init_file_cache(extensions)
 
         _basename = os.path.basename
+        suffixes = tuple(f'.{ext}' for ext in extensions)
 
-        for filepath in recursive_get_files(path):
+        for filepath in recursive_get_files(path, suffixes):
             filename = _basename(filepath)
-            *name_no_ext, ext = filename.lower().rsplit('.', 1)
+            name_no_ext, ext = filename.lower().rsplit('.', 1)
 
-            if not (name_no_ext and ext):
+            if not name_no_ext:
                 continue
-            elif ext not in self.file_cache:
-                continue
-            else:
-                name_no_ext = name_no_ext[0]
 
             self._push_file_cache(extension=ext,
                                   filekey=name_no_ext,
@@ -240,33 +259,29 @@ class CorpusLoader:
         """
         cache = self._cache_files(self.CORPUS_DIRECTORY, ['wav', 'textgrid'])
 
-        wav_keys = set(cache['wav'].keys())
-        tg_keys = set(cache['textgrid'].keys())
+        # Single pass over the wav cache, popping matched keys out of a copy
+        # of the textgrid cache; whatever survives the pass is tg-only
+        tg_remaining = dict(cache['textgrid'])
+        matches = {}
+        unmatched = dict(wav=[], textgrid=[])
 
-        try:
-            assert wav_keys == tg_keys
+        for filename_no_ext, wavpath in cache['wav'].items():
+            tgpath = tg_remaining.pop(filename_no_ext, None)
+            if tgpath is None:
+                unmatched['wav'].append(f'{filename_no_ext}.wav')
+            else:
+                matches[filename_no_ext] = (wavpath, tgpath)
 
-        except AssertionError:
+        unmatched['textgrid'] = [f'{filename_no_ext}.TextGrid'
+                                 for filename_no_ext in tg_remaining]
+
+        if unmatched['wav'] or unmatched['textgrid']:
             msg = ('failed to match some TextGrid files to WAV files or vice '
                    'versa')
             if raise_unmatched:
                 raise AssertionError(msg)
             warnings.warn(msg)
 
-        matches = {}
-        for filename_no_ext in wav_keys.intersection(tg_keys):
-            wavpath = cache['wav'][filename_no_ext]
-            tgpath = cache['textgrid'][filename_no_ext]
-            matches[filename_no_ext] = (wavpath, tgpath)
-
-        diff = wav_keys.symmetric_difference(tg_keys)
-        unmatched = dict(wav=[], textgrid=[])
-
-        for ext, other_ext_keys in [('wav', tg_keys), ('textgrid', wav_keys)]:
-            unmatched[ext] = [f'{file}.{ext.replace("textgrid", "TextGrid")}'
-                              for file in diff
-                              if file not in other_ext_keys]
-
         return matches, unmatched
 
 
@@ -293,32 +308,36 @@ class CorpusLoader:
 
         matches, unmatched = self.find_matches_textgrid_to_wav(raise_unmatched)
 
-        convos = defaultdict(list)
+        convos = {}
 
         # Create a conversation ID ("convokey") and collect files with names
-        # beginning with the ID into a list.
+        # beginning with the ID into a list. Validate while collecting so a
+        # third pair for any convo fails immediately rather than after a
+        # second pass over the whole mapping.
         for filename_no_ext, (wavpath, tgpath) in matches.items():
-            match = self.file_pattern_sameroom.match(filename_no_ext)
-            if not match:
-                match = self.file_pattern_seproom.match(filename_no_ext)
+            match = self.file_pattern_combined.match(filename_no_ext)
             if not match:
                 err = f'unrecognized filename format: {filename_no_ext}'
                 raise ValueError(err)
 
-            # Extract convo ID from the regex match; push into list
-            convokey = match.groups()[0]
-            convos[convokey].append((wavpath, tgpath))
+            # Extract convo ID from whichever format matched; push into list
+            convokey = match.group('same') or match.group('sep')
+            speakerfiles = convos.setdefault(convokey, [])
+            speakerfiles.append((wavpath, tgpath))
+            if len(speakerfiles) > 2:
+                raise ValueError(f'expected two pairs of files per convo but '
+                                 f'found {len(speakerfiles)} pairs for '
+                                 f'{convokey}')
 
-        # Combine the lists in the defaultdict[list] into a Map[str, tuple] for
-        # immutability and to save RAM
+        # Flatten into a Map[str, tuple] for immutability and to save RAM:
+        # [(wav1, tg1), (wav2, tg2)] -> (wav1, tg1, wav2, tg2)
         convos_dict = {}
         for convokey, speakerfiles in convos.items():
-            num_speakers = len(speakerfiles)
-            if num_speakers != 2:
+            if len(speakerfiles) != 2:
                 raise ValueError(f'expected two pairs of files per convo but '
-                                 f'found {num_speakers} pairs for {convokey}')
+                                 f'found {len(speakerfiles)} pairs for '
+                                 f'{convokey}')
 
-            # [(wav1, tg1), (wav2, tg2)] -> (wav1, tg1, wav2, tg2)
             speaker1, speaker2 = speakerfiles
             convos_dict[convokey] = (*speaker1, *speaker2)
 
@@ -356,17 +375,29 @@ class Conversation:
 
     @classmethod
     def open_textgrid(cls, filepath, codecs=['utf-8', 'utf-8-sig']):
-        """Reads the text from TextGrid file"""
+        """Reads the text from TextGrid file
+
+        Reads the raw bytes in one go and decodes once, which is faster
+        than text-mode I/O for multi-MB TextGrids. Previously the codec
+        loop variable was ignored and every attempt used utf-8-sig.
+        """
+        with open(filepath, 'rb') as f:
+            data = f.read()
+
         for enc in codecs:
             try:
-                with open(filepath, 'r', encoding='utf-8-sig') as f:
-                    rawtext = f.read()
-                    break
+                rawtext = data.decode(enc)
+                break
             except UnicodeDecodeError:
                 pass
         else:
             raise ValueError("couldn't open {} using codes: {}".format(
                 filepath, ', '.join(codecs)))
+
+        # Plain utf-8 decoding leaves any BOM in place; strip it so the
+        # result matches what utf-8-sig would have produced
+        if rawtext.startswith('\ufeff'):
+            rawtext = rawtext[1:]
         return rawtext
 
 
@@ -377,47 +408,86 @@ class Conversation:
         Yields interval.Interval objects.
         """
         rawtext = cls.open_textgrid(filepath)
-        repatt = Interval.interval_grouped_pattern
-        basename = os.path.basename(filepath)
 
-        for ivtext, *_ in repatt.findall(rawtext):
-            yield Interval.from_text(ivtext, textgrid=filepath)
-        yield False
+        for match in Interval.interval_pattern.finditer(rawtext):
+            yield Interval._from_match(match, textgrid=filepath)
 
 
     def linearize(self):
         """Yield Intervals from the 2 TextGrids in chronological order"""
-        gen1 = self.generate_intervals(self.textgrid1)
-        gen2 = self.generate_intervals(self.textgrid2)
+        return heapq.merge(self.generate_intervals(self.textgrid1),
+                           self.generate_intervals(self.textgrid2),
+                           key=operator.attrgetter('xmin'))
 
-        iv1, iv2 = gen1.__next__(), gen2.__next__()
 
-        while True:
-            if iv1 == iv2 == False:
-                raise StopIteration
+    def iter_tokens(self):
+        """Yields (interval, token) pairs across the whole conversation
 
-            if iv1 and iv2:
-                if iv1.xmin <= iv2.xmin:
-                    yield iv1
-                    iv1 = gen1.__next__()
+        Fuses linearize() with tokenization: the token pattern and discard
+        checks are bound once for the conversation and each interval gets a
+        single finditer sweep, instead of building a fresh token list per
+        interval through Interval.tokens. Tokens are produced with the same
+        default filters as Interval.tokenize(): fillers, non-content tags
+        and incomplete words are discarded.
+        """
+        patt = Interval.make_lexer_pattern()
+        noncontent = _TAGS_NONCONTENT_LOWER
+        _token = Token
+        _sentinels = Token._tag_sentinels
+
+        for iv in self.linearize():
+            text = iv.text.lower()
+            for match in patt.finditer(text):
+                word = match.group()
+                if (word.endswith('~')
+                    or word in noncontent
+                    or (word.startswith('(')
+                        and not word.startswith('(pp'))
+                ):
+                    continue
+
+                kind = match.lastgroup
+                if kind != 'word':
+                    yield iv, _token(word, already_lower=True, tag=Tag[kind])
+                elif _sentinels.isdisjoint(word):
+                    yield iv, _token(word, already_lower=True, tag=None)
                 else:
-                    yield iv2
-                    iv2 = gen2.__next__()
-                continue
+                    # Word with clitic characters; let Token find the tag
+                    yield iv, _token(word, already_lower=True)
+
+
+    def __repr__(self):
+        return f'<Conversation: {self.name}>'
 
-            break
 
-        # Either gen1 or gen2 depleted
-        gen = gen1 if iv1 else gen2
-        iv = iv1 or iv2
+def _parse_convo(files):
+    """Parses one conversation's files into a list of Intervals
 
-        # Yield the non-false item, then deplete its generator
-        while iv:
-            yield iv
-            iv = gen.__next__()
+    Module-level so it can be pickled into worker processes.
+    """
+    wav1, tg1, wav2, tg2 = files
+    return list(Conversation(wav1, tg1, wav2, tg2).linearize())
 
-        raise StopIteration
 
+def iter_all_intervals(loader: CorpusLoader, workers=None, chunksize=8):
+    """Yields Intervals from every conversation found by the loader
 
-    def __repr__(self):
-        return f'<Conversation: {self.name}>'
+    Parsing each conversation is independent, regex-heavy CPU work, so the
+    conversations are fanned out across a process pool (one conversation
+    per task), which sidesteps the GIL and scales with core count.
+
+    Arguments:
+    loader: CorpusLoader - Loader pointed at the corpus root.
+
+    workers: int - Number of worker processes; None lets the pool pick
+                   one per CPU.
+
+    chunksize: int - Conversations per task batch, to amortize the
+                     inter-process transfer cost.
+    """
+    convos = loader.find_convo_pairs()
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for intervals in executor.map(_parse_convo, convos.values(),
+                                      chunksize=chunksize):
+            yield from intervals